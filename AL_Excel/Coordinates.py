@@ -3,8 +3,9 @@
     Implementation of a Coordinate Class which makes it easier to handle locations
 """
 ## Super Module
-from openpyxl import utils
+from openpyxl.utils.cell import column_index_from_string, get_column_letter
 ## Builtin
+import functools
 import re
 import typing
 
@@ -51,16 +52,54 @@ class Coordinate():
     Each part of a Coordinate instance (row and column) is a namedtuple called Index with parts (type, value, absolute) where type indicates "row" or "column",
     value is the reference, and absolute is a boolean (True or False).
     """
+    ## Coordinates are created in bulk (e.g.- one per cell), so avoid a per-instance __dict__
+    __slots__ = ("_row","_column","_key","_a1column")
+
     def __init__(self,row: IndexDescriptor|CoordinateDescriptor|None, column: IndexDescriptor|None = False):
-        if isinstance(row,str) and column is False:
-            row,column = converttotuple(row)
+        ## Fast path for the most common case (two integers), which converttotuple would resolve to
+        ## an absolute row and column anyway (type() excludes bools)
+        if type(row) is int and type(column) is int:
+            row,column = Index("row", row, True),Index("column", column, True)
+        elif isinstance(row,str) and column is False:
+            row,column = parsecoordstring(row)
         else:
             if column is False: column = None
-            try: row,column = converttotuple((row,column))
+            try: row,column = convertpair(row,column)
             except Exception as e:
-                raise AttributeError(f"Invalid values for cooridinate: {row},{column}")
+                raise AttributeError(f"Invalid values for cooridinate: {row},{column}") from e
+        self._setindices(row,column)
+
+    @classmethod
+    def from_many(cls, values: typing.Iterable[str])-> list["Coordinate"]:
+        """ Creates a Coordinate for each A1 or R1C1 Notation string in values.
+
+            All of the strings are matched in a single regex pass, which is faster than creating
+            each Coordinate individually when parsing a large number of addresses.
+            Raises the same errors as Coordinate(value) if any value is invalid.
+        """
+        values = list(values)
+        joined = "\n".join(values)
+        matches = list(MANYRE.finditer(joined))
+        ## Each value should produce exactly one match (and no value should contain a newline of its own)
+        if len(matches) != len(values) or joined.count("\n") != len(values) - 1:
+            ## Let the individual constructor raise the appropriate error
+            return [cls(value) for value in values]
+        out = []
+        for regex in matches:
+            coordinate = cls.__new__(cls)
+            coordinate._setindices(*indicesfrommatch(regex))
+            out.append(coordinate)
+        return out
+
+    def _setindices(self, row: Index, column: Index)-> None:
+        """ Sets the Coordinate's row and column Indexes """
         self._row = row
         self._column = column
+        ## Used for comparison and hashing
+        self._key = (row,column)
+        ## Column letter for toA1string (determined on first use)
+        self._a1column = None
+
     @property
     def row(self)->int|None:
         return self._row.value if self._row else None
@@ -75,9 +114,12 @@ class Coordinate():
             By default, will output absolute dollar signs (ex.- A$1).
             If absolute is False, will output both row and column as relative.
         """
+        column = self._a1column
+        if column is None:
+            column = self._a1column = get_column_letter(self._column.value)
         if not absolute:
-            return f"{utils.cell.get_column_letter(self._column.value)}{self._row.value}"
-        return f'{"$" if self._row.absolute else ""}{utils.cell.get_column_letter(self._column.value)}{"$" if self._column.absolute else ""}{self._row.value}'
+            return f"{column}{self._row.value}"
+        return f'{"$" if self._column.absolute else ""}{column}{"$" if self._row.absolute else ""}{self._row.value}'
     
     def __add__(self,other: "Coordinate"|IndexDescriptor|CoordinateDescriptor|None)->"Coordinate":
 
@@ -88,56 +130,132 @@ class Coordinate():
             
             return Coordinate(row = addindices(self._row,other._row), column = addindices(self._column, other._column))
         
-        ## Otherwise, try to convert to Coordinate
-        ## Conversion will automatically handle Address Strings and 2-length iterables (i.e. (row,column) Tuple)
-        try: return self + Coordinate(other)
-        except: pass
+        ## Otherwise, convert to Coordinate
+        ## 2-length iterables are (row,column) Tuples; Address Strings and single indices are passed as-is
+        if isinstance(other,(tuple,list)) and not isinstance(other,Index):
+            return self + Coordinate(*other)
+        if isinstance(other,(str,int,Index)):
+            return self + Coordinate(other)
+        return NotImplemented
 
     def __eq__(self,other: "Coordinate")->bool:
-        if isinstance(other,Coordinate):
-            return self._row == other._row and self._column == other._column
-        
+        return isinstance(other,Coordinate) and self._key == other._key
+
+    def __hash__(self)->int:
+        return hash(self._key)
+
     def __repr__(self):
-        return f"{self.__class__}({self._row},{self._column})"
+        return f"{type(self).__name__}({self._row!r},{self._column!r})"
 
 
 
 ## Order than Coordinates should be displayed
 COORDINATEORDER = ["row","column"]
 
-FULLRE = re.compile("""
-^(?P<match>
-    (?P<RC>
-        (?P<RCrow>R                                                 ## R1C1
-            (?P<absolute1>\[?)(?P<RCrowid>-?\d+)(?P<absolute2>\]?)
-        )
-        (?P<RCcolumn>C
-            (?P<absolute3>\[)?(?P<RCcolumnid>-?\d+)(?P<absolute4>\]?)
-        )
-    )
-    |
-    (?P<A1>                                                         ## A1
-        (?P<A1column>
-            (?P<absoluteB>\$?)(?P<A1columnid>[A-Z]+)
-        )
-        (?P<A1row>
-            (?P<absoluteA>\$?)(?P<A1rowid>\d+)
-        )
-    )                 
-)$
-""", re.VERBOSE | re.IGNORECASE)
-COLUMNRE = re.compile("""
-(?P<match>
-      C(?P<absolute1>\[?)(?P<RCcolumn>-?\d+)(?P<absolute2>\]?)    ## R1C1
-    | (?P<absolute>\$?)(?P<A1column>[A-Z]+)                     ## A1
-)
-""", re.VERBOSE | re.IGNORECASE)
-ROWRE = re.compile("""
-(?P<match>
-      R(?P<absolute1>\[?)(?P<RCrow>-?\d+)(?P<absolute2>\]?)   ## R1C1
-    | (?P<absolute>\$?)(?P<A1row>\d+)                       ## A1
-)
-""", re.VERBOSE | re.IGNORECASE)
+## Positional groups:
+##  R1C1: (1) row "[", (2) row index, (3) row "]", (4) column "[", (5) column index, (6) column "]"
+##  A1:   (7) column "$", (8) column letters, (9) row "$", (10) row index
+FULLRE = re.compile(r"R(\[?)(-?\d+)(\]?)C(\[?)(-?\d+)(\]?)|(\$?)([A-Z]+)(\$?)(\d+)", re.IGNORECASE)
+## FULLRE anchored to individual lines, for matching many newline-separated coordinates at once
+MANYRE = re.compile(rf"^(?:{FULLRE.pattern})$", re.IGNORECASE | re.MULTILINE)
+## Positional groups:
+##  R1C1: (1) "R" or "C", (2) "[", (3) index, (4) "]"
+##  A1:   (5) "$", (6) column letters or row index (which may be negative if relative)
+INDEXRE = re.compile(r"([RC])(\[?)(-?\d+)(\]?)|(\$?)([A-Z]+|-?\d+)", re.IGNORECASE)
+
+def rcindex(colrow: IndexType, opening: str, value: str, closing: str)-> Index:
+    """ Creates an Index from the parts of an R1C1 index, validating that the brackets are balanced
+
+    Parameters:
+        colrow: Whether the index is a column or row index
+        opening: The opening bracket (or an empty string)
+        value: The index's value
+        closing: The closing bracket (or an empty string)
+
+    Returns:
+        Index: A namedtuple with parts (type, value, absolute)
+    """
+    abs1,abs2 = bool(opening),bool(closing)
+    ## If both are not true, then we are missing one of the brackets
+    if abs1 != abs2:
+        ## If abs1 is True, then we are missing the closing bracket (abs2)
+        missing = "]" if abs1 else "["
+        raise SyntaxError(f"Incomplete coordinate description: missing {missing}.")
+    return Index(colrow, int(value), abs1)
+
+@functools.lru_cache(maxsize = 4096)
+def parsecoordstring(value: str)-> tuple[Index,Index]:
+    """ Parses an A1 or R1C1 Notation string into a tuple of Indexes representing a row and column.
+
+        Results are cached, since the same handful of addresses tend to be parsed over and over
+        (Indexes are immutable, so the cached tuples are safe to share).
+
+        Parameters:
+            value: The string to parse
+
+        Returns:
+            tuple[Index,Index]: A tuple of Indexes representing a row and column index
+    """
+    regex = FULLRE.fullmatch(value)
+    if not regex:
+        raise TypeError(f"Invalid coordinates: {value}")
+    return indicesfrommatch(regex)
+
+def indicesfrommatch(regex: re.Match)-> tuple[Index,Index]:
+    """ Converts a successful FULLRE (or MANYRE) match into a tuple of Indexes representing a row and column.
+
+        Parameters:
+            regex: The match object
+
+        Returns:
+            tuple[Index,Index]: A tuple of Indexes representing a row and column index
+    """
+    rowopen,rcrow,rowclose,columnopen,rccolumn,columnclose,columnabsolute,a1column,rowabsolute,a1row = regex.groups()
+    ## R1C1
+    if rcrow is not None:
+        return rcindex("row",rowopen,rcrow,rowclose),rcindex("column",columnopen,rccolumn,columnclose)
+    ## A1
+    return (Index("row", int(a1row), bool(rowabsolute)),
+            Index("column", column_index_from_string(a1column), bool(columnabsolute)))
+
+def resolvetypes(type1: IndexType|None, absolute1: bool, type2: IndexType|None, absolute2: bool)-> tuple[IndexType,IndexType]|None:
+    """ Determines the final types of a pair of Indexes (neither of which is a None Index) based on their
+        current types and absolute values.
+
+        Parameters:
+            type1: The first Index's type
+            absolute1: The first Index's absolute value
+            type2: The second Index's type
+            absolute2: The second Index's absolute value
+
+        Returns:
+            tuple[IndexType,IndexType]|None: The types the Indexes should have, or None if the pair is invalid
+    """
+    ## row/column are ambiguous: assign their types in order
+    if type1 is None and type2 is None:
+        return "row","column"
+
+    ## Indices are of the same type: the only way this should happen is because of the User
+    ## e.g.- Coordinate("A","A"), Coordinate("1","1")
+    if type1 == type2:
+        ## If both are rows, then we can try assume one to actually be a column index
+        if type1 == "row":
+            ## If only one is absolute, then the other can be assumed to be relative (and therefore the column)
+            ## If neither is absolute, then they are taken in order
+            if absolute1 and absolute2: return None
+            if absolute2: return "column","row"
+            return "row","column"
+        return None
+
+    ## An ambiguous index takes whichever type the other index does not have
+    if type1 is None: return ("column" if type2 == "row" else "row"), type2
+    if type2 is None: return type1, ("column" if type1 == "row" else "row")
+    return type1,type2
+
+## Lookup table for resolvetypes, keyed by (type1, absolute1, type2, absolute2)
+TYPERESOLUTIONS = {(type1, absolute1, type2, absolute2): resolvetypes(type1, absolute1, type2, absolute2)
+                   for type1 in ("row","column",None) for absolute1 in (True,False)
+                   for type2 in ("row","column",None) for absolute2 in (True,False)}
 
 def converttotuple(value: CoordinateDescriptor) -> tuple[Index,Index]:
     """ Converts a value into a tuple of Indexes ambiguously representing a row and column.
@@ -153,86 +271,53 @@ def converttotuple(value: CoordinateDescriptor) -> tuple[Index,Index]:
             tuple[Index,Index]: A tuple of Indexes representing a row and column index
     """
     if isinstance(value,str):
-        regex = FULLRE.search(value)
-        if regex:
-            syntax = "RC" if regex.group("RC") else "A1"
-            row = parsecoordregex(regex.group(f"{syntax}row"),'row')
-            column = parsecoordregex(regex.group(f"{syntax}column"),'column')
-            return row,column
-        else:
-            raise TypeError(f"Invalid coordinates: {value}")
-        
-    
+        return parsecoordstring(value)
+
     try: index1,index2 = value
     except: raise TypeError(f"Cooridinates must be Coordinate-Formatted string or a tuple: {value}")
+    return convertpair(index1,index2)
 
-    indices = [parseindex(index1),parseindex(index2)]
+def convertpair(index1: IndexDescriptor, index2: IndexDescriptor)-> tuple[Index,Index]:
+    """ Converts a pair of index values into a tuple of Indexes representing a row and column.
 
-    nonindices = [index.value for index in indices if index.value is None]
+        Parameters:
+            index1: The first index, which should be a valid value for parseindex
+            index2: The second index, which should be a valid value for parseindex
+
+        Returns:
+            tuple[Index,Index]: A tuple of Indexes representing a row and column index
+    """
+    index1,index2 = parseindex(index1),parseindex(index2)
+    noindex1,noindex2 = index1.value is None,index2.value is None
 
     ## Both are None indexes
-    if len(nonindices) >= 2:
-        raise ValueError(f"No Indicies provided: {indices}")
+    if noindex1 and noindex2:
+        raise ValueError(f"No Indicies provided: {[index1,index2]}")
     
-    if nonindices:
-        goodind = 0 if indices[0].value is not None else 1
-        goodindex = indices[goodind]
-
-        ## If goodindex is ambiguous, then we need to set it's type
-        if goodindex.type is None:
-            ## type is determined by position in the tuple 
-            ## i.e. (None,1) -> (NoneIndex,AmbiguousIndex==1) -> (NoneRowIndex,ColumnIndex==1)
-            goodindex = goodindex._replace(type = COORDINATEORDER[goodind])
-
-        ## Otherwise, we need to double-check goodindex's position in the tuple
+    if noindex1 or noindex2:
+        ## If the good index is ambiguous, then we need to set it's type
+        ## type is determined by position in the tuple 
+        ## i.e. (None,1) -> (NoneIndex,AmbiguousIndex==1) -> (NoneRowIndex,ColumnIndex==1)
+        ## Otherwise, we need to double-check the good index's position in the tuple
+        if noindex1:
+            if index2.type is None: index2 = Index("column", index2.value, index2.absolute)
+            elif index2.type != "column": return index2,index1
         else:
-            if goodindex.type != COORDINATEORDER[goodind]:
-                indices[0],indices[1] = indices[1],indices[0]
+            if index1.type is None: index1 = Index("row", index1.value, index1.absolute)
+            elif index1.type != "row": return index2,index1
 
         ## Output will be (NoneRow, column) or (row, NoneColumn)
-        return indices
-
-    ## row/column are ambiguous
-    if indices[0].type is None and indices[1].type is None:
-        ## Assign their types in order
-        indices[0] = indices[0]._replace(type = "row")
-        indices[1] = indices[1]._replace(type = "column")
-        return indices
+        return index1,index2
 
-    ## Indices are of the same type: the only way this should happen is because of the User
-    ## e.g.- Coordinate("A","A"), Coordinate("1","1")
-    if indices[0].type == indices[1].type:
-        ## If both are rows, then we can try assume one to actually be a column index
-        if indices[0].type == "row" and indices[1].type == "row":
-            ## If only one is absolute, then the other can be assumed to be relative
-            if indices[0].absolute and not indices[1].absolute:
-                indices[1] = indices[1]._replace(type='column')
-            elif indices[1].absolute and not indices[0].absolute:
-                indices[1] = indices[0]._replace(type='column')
-            elif not indices[0].absolute and not indices[1].absolute:
-                indices[1] = indices[1]._replace(type='column')
-            else:
-               raise ValueError(f"Duplicated Arguments: {indices[0].type},{indices[1].type}")
-        else:
-            raise ValueError(f"Duplicated Arguments: {indices[0].type},{indices[1].type}")
-
-    row = [index for index in indices if index.type == "row"]
-    column = [index for index in indices if index.type == "column"]
-    ambiguous = [index for index in indices if index.type is None]
-
-    if row and not column:
-        row = row[0]
-        column = ambiguous[0]
-        column = column._replace(type = "column")
-    elif column and not row:
-        column = column[0]
-        row = ambiguous[0]
-        row = row._replace(type = "row")
-    else:
-        row = row[0]
-        column = column[0]
+    types = TYPERESOLUTIONS[(index1.type, index1.absolute, index2.type, index2.absolute)]
+    if types is None:
+        raise ValueError(f"Duplicated Arguments: {index1.type},{index2.type}")
+    type1,type2 = types
+    if index1.type != type1: index1 = Index(type1, index1.value, index1.absolute)
+    if index2.type != type2: index2 = Index(type2, index2.value, index2.absolute)
 
-    return row,column
+    if type1 == "row": return index1,index2
+    return index2,index1
 
     
 
@@ -259,19 +344,16 @@ def parseindex(value: IndexDescriptor)->Index:
         return Index(None,value,True)
     
     if isinstance(value,str):
-        try:
-            return parsecoordregex(value,"column")
-        except:
-            return parsecoordregex(value,"row")
+        return parsecoordregex(value)
         
     ## Validate a Index
     ## Note, namedtuple is an instance of tuple, so this has to happen before handling tuple/lists
     if isinstance(value,Index):
         ## Index should be "row","column" (, or None for Column References)
-        if value.type not in ["row","column",None]: raise ValueError(f"Index's type should be 'row','column', or None: {value}")
+        if value.type not in ("row","column",None): raise ValueError(f"Index's type should be 'row','column', or None: {value}")
         ## Index made by this module use column index (or None for Column References)
         if not isinstance(value.value,int) and value.value is not None: raise ValueError(f"Index's value is not an integer (or None): {value}")
-        if value.absolute not in [True,False]: raise ValueError(f"Index's absolute value is not True or False: {value}")
+        if value.absolute not in (True,False): raise ValueError(f"Index's absolute value is not True or False: {value}")
         return value
 
     if isinstance(value,(tuple,list)):
@@ -286,12 +368,13 @@ def parseindex(value: IndexDescriptor)->Index:
             if isinstance(absolute,str):
                 absolute = absolute.lower()
                 ## Acceptable absolute = True values
-                if absolute in ["$","absolute"]: absolute = True
+                if absolute in ("$","absolute"): absolute = True
                 ## Only absolute = False value
                 elif absolute == "": absolute = False
                 else: raise ValueError(f"Coordinate part's second index is an unknown string: {value[1]}")
 
-            if absolute not in [0,1,True,False]:
+            ## 0 and 1 compare equal to False and True, so they are accepted as well
+            if absolute not in (True,False):
                 raise ValueError(f"Coordinate part's second index must be True or False, or an accepted alias: {absolute}")
             
             ## Check collision between index defined in value[0]:
@@ -299,42 +382,39 @@ def parseindex(value: IndexDescriptor)->Index:
             if index.absolute and not absolute:
                 raise ValueError(f"Coordinate part's second index contradicts the first: {value}")
             
-            index = Index(index.type, index.value, absolute)
+            index = Index(index.type, index.value, bool(absolute))
         return index
 
     ## Everything else
     raise ValueError(f"Coordinate part is not a recognized format: {value}")
 
-def parsecoordregex(value: str,colrow: IndexType)->Index:
-    """ Parses a string using a regex to determine the index and absolute value
+def parsecoordregex(value: str,colrow: IndexType|None = None)->Index:
+    """ Parses a string using a regex to determine the index's type, value, and absolute value
     
     Parameters:
         value: The string to parse
-        colrow: Whether the string is a column or row index
+        colrow: Whether the string is a column or row index; if None, the type is determined by the string
     
     Returns:
         Index: A namedtuple with parts (type, value, absolute)
     """
-    if colrow not in ("column","row"): raise ValueError(f"parsecoordregex must be 'column' or 'row': {colrow}")
+    if colrow not in ("column","row",None): raise ValueError(f"parsecoordregex must be 'column', 'row', or None: {colrow}")
 
-    if colrow == "column": regex = COLUMNRE.search(value)
-    else: regex = ROWRE.search(value)
-    if not regex: raise ValueError(f"String does not match any identifiable {colrow} patterns: {value}")
+    regex = INDEXRE.fullmatch(value)
+    if not regex: raise ValueError(f"String does not match any identifiable {colrow or 'index'} patterns: {value}")
 
-    if regex.group(f"A1{colrow}"):
-        index = regex.group(f"A1{colrow}")
-        if colrow == "column": index = utils.cell.column_index_from_string(index)
-        index = int(index)
-        return Index(colrow, index, bool(regex.group("absolute")))
+    rcprefix,opening,rcvalue,closing,absolute,a1value = regex.groups()
+    if a1value:
+        if a1value[-1].isdigit():
+            if absolute and a1value[0] == "-": raise ValueError(f"Absolute indexes cannot be negative: {value}")
+            index = Index("row", int(a1value), bool(absolute))
+        else: index = Index("column", column_index_from_string(a1value), bool(absolute))
     else:
-        abs1,abs2 = bool(regex.group("absolute1")),bool(regex.group("absolute2"))
-        ## If both are not true, then we are missing one of the brackets
-        if abs1 != abs2:
-            ## If abs1 is True, then we are missing the closing bracket (abs2)
-            missing = "]" if abs1 else "["
-            raise SyntaxError(f"Incomplete coordinate description: missing {missing}.")
-        
-        return Index(colrow, int(regex.group(f"RC{colrow}")),abs1 and abs2)
+        index = rcindex("row" if rcprefix in ("R","r") else "column",opening,rcvalue,closing)
+
+    if colrow and index.type != colrow:
+        raise ValueError(f"String does not match any identifiable {colrow} patterns: {value}")
+    return index
 
 def addindices(index1: Index,index2: Index)-> Index:
     """ Adds two indices together. Both must have the same type and at least one must be relative (Index.absolute == False)
@@ -9,10 +9,11 @@ from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell import Cell
 
 ## This Module
-from AL_Excel import Coordinate, Index
+from AL_Excel import Coordinate
 from AL_Excel.Coordinates import CoordinateDescriptor
 
 ## Builtins
+import itertools
 import typing
 
 __all__ = ["NamedRange","Range"]
@@ -151,7 +152,11 @@ class Range():
 
     def row(self,index,attribute: typing.Literal["value","address","cell"] = "value")-> typing.Generator[Cell,None,None]:
         """ Returns the row with the provided zero-index, via rows_from_range """
-        return list(self.rows_from_range(attribute=attribute))[index]
+        ## Negative indices count from the end, so they require the full list of rows
+        if index < 0: return list(self.rows_from_range(attribute=attribute))[index]
+        for row in itertools.islice(self.rows_from_range(attribute=attribute),index,None):
+            return row
+        raise IndexError("list index out of range")
 
     def column(self,index,attribute: typing.Literal["value","address","cell"] = "value")-> typing.Generator[Cell,None,None]:
         """ Returns the column with the provided zero-index, via columns_from_range """
@@ -166,20 +171,20 @@ class Range():
     def coordinatetocell(self, coordinate: Coordinate) -> Cell:
         """ Converts a Coordinate (which may be relative) to a Cell (which is absolute) based on the first index of the range """
         ## Note that range_boundaries is a CR pattern rather than RC
+        ## Coordinates are hashable, so the relative coordinate is resolved into locals rather than modified in place
+        row,column = coordinate.row,coordinate.column
         if not coordinate.isabsolute():
             if not coordinate._row.absolute:
-                if coordinate.row >= 0:
-                    row  = self.masterstart.row + coordinate.row
+                if row >= 0:
+                    row  = self.masterstart.row + row
                 else:
-                    row = self.masterend.row + coordinate.row + 1
-                coordinate._row = Index("row",row,True)
+                    row = self.masterend.row + row + 1
             if not coordinate._column.absolute:
-                if coordinate.column >= 0:
-                    column = self.masterstart.column + coordinate.column
+                if column >= 0:
+                    column = self.masterstart.column + column
                 else:
-                    column = self.masterend.column + coordinate.column + 1
-                coordinate._column = Index("column",column,True)
-        return self.worksheet.cell(row = coordinate.row, column = coordinate.column)
+                    column = self.masterend.column + column + 1
+        return self.worksheet.cell(row = row, column = column)
 
     def subrange(self,start: Coordinate|CoordinateDescriptor = None, end: Coordinate|CoordinateDescriptor = None)-> "Range":
         """ Returns a new Range Object that is a slice of this Range Object
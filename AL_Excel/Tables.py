@@ -8,6 +8,7 @@ from openpyxl.worksheet.table import Table, TableColumn
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell import Cell
+from openpyxl.utils.cell import get_column_letter
 #### Necessary for checking worksheet type
 from openpyxl.chartsheet.chartsheet import Chartsheet
 ## This Module
@@ -15,11 +16,18 @@ from AL_Excel import Coordinate, Range
 from AL_Excel.Coordinates import CoordinateDescriptor
 from AL_Excel.Ranges import tuple_to_range
 ## Builtin
-import collections
 import itertools
 
 __all__ = ["EnhancedTable",]
 
+## Table attributes which are copied by EnhancedTable.from_table
+TABLEFIELDS = ("id", "displayName", "ref", "name", "comment", "tableType",
+               "headerRowCount", "insertRow", "insertRowShift", "totalsRowCount", "totalsRowShown",
+               "published", "headerRowDxfId", "dataDxfId", "totalsRowDxfId", "headerRowBorderDxfId",
+               "tableBorderDxfId", "totalsRowBorderDxfId", "headerRowCellStyle", "dataCellStyle",
+               "totalsRowCellStyle", "connectionId", "autoFilter", "sortState", "tableColumns",
+               "tableStyleInfo", "extLst")
+
 class EnhancedTable(Table):
     """ A better Table Class, returned by get_all_tables """
     def from_table(table: Table, worksheet: Worksheet)-> "EnhancedTable":
@@ -40,13 +48,7 @@ class EnhancedTable(Table):
             oldversion()
         
         ## If no EnhancedTable version found, create one (which- again- seems to automatically be added to the _tables list)
-        return EnhancedTable(worksheet = worksheet,
-                             id=table.id, displayName=table.displayName, ref=table.ref, name=table.name, comment=table.comment, tableType=table.tableType,
-                             headerRowCount=table.headerRowCount, insertRow=table.insertRow, insertRowShift=table.insertRowShift, totalsRowCount=table.totalsRowCount, totalsRowShown=table.totalsRowShown,
-                             published=table.published, headerRowDxfId=table.headerRowDxfId, dataDxfId=table.dataDxfId, totalsRowDxfId=table.totalsRowDxfId, headerRowBorderDxfId=table.headerRowBorderDxfId,
-                             tableBorderDxfId=table.tableBorderDxfId, totalsRowBorderDxfId=table.totalsRowBorderDxfId, headerRowCellStyle=table.headerRowCellStyle, dataCellStyle=table.dataCellStyle,
-                             totalsRowCellStyle=table.totalsRowCellStyle, connectionId=table.connectionId, autoFilter=table.autoFilter, sortState=table.sortState, tableColumns=table.tableColumns,
-                             tableStyleInfo=table.tableStyleInfo, extLst=table.extLst)
+        return EnhancedTable(worksheet = worksheet, **{field: getattr(table,field) for field in TABLEFIELDS})
     
     def __init__(self,worksheet: Worksheet, **kw):
         self.worksheet = worksheet
@@ -83,17 +85,23 @@ class EnhancedTable(Table):
         if index >= collen: raise ValueError("Index outside of Table Range")
         if columnname is None:
             columnname = f"Column{collen}"
-        if columnname in [column.name for column in self.tableColumns]:
+        existing = {column.name for column in self.tableColumns}
+        while columnname in existing:
             columnname = columnname + " 2"
         self.tableColumns.insert(index,TableColumn(id=collen,name=columnname))
-        self.range += [1,None]
+        ## Extend the table by one column
+        self.range.endcoord = self.range.endcoord + ("0","1")
 
-    def headers(self, attribute: typing.Literal["value","address","cell"] = "value")-> list[str|Cell|Coordinate]:
-        """ Returns the headers of the EnhancedTable as a list, via self.range.row """
+    def iterheaders(self, attribute: typing.Literal["value","address","cell"] = "value")-> typing.Iterator[str|Cell|Coordinate]:
+        """ Iterates over the headers of the EnhancedTable, via self.range.row """
         ## Last row (equal to row count) should contain actual headers... In theory
         ## And we zero-index it
         headerrow = self.headerRowCount - 1
-        return list(self.range.row(headerrow,attribute=attribute))
+        return self.range.row(headerrow,attribute=attribute)
+
+    def headers(self, attribute: typing.Literal["value","address","cell"] = "value")-> list[str|Cell|Coordinate]:
+        """ Returns the headers of the EnhancedTable as a list (see iterheaders) """
+        return list(self.iterheaders(attribute=attribute))
 
     def addheaders(self, headers):
         """ Adds a set of headers to the table at the bottom of the header range """
@@ -112,7 +120,7 @@ class EnhancedTable(Table):
         return self.range.subrange(
             (str(headerlength),str(0)),None)
 
-    def todicts(self,keyfactory: typing.Callable = None, attribute: typing.Literal["value","address","cell"] = "value")-> list[collections.OrderedDict]:
+    def todicts(self,keyfactory: typing.Callable = None, attribute: typing.Literal["value","address","cell"] = "value")-> list[list|dict]:
         """ Converts all data rows to dicts based on column headers. The first element of the returned list is a list of the header strings used.
         
         keyfactory is an callback function to modify the keys (example- the lowerstrip lambda available in this module executes
@@ -120,36 +128,31 @@ class EnhancedTable(Table):
         attribute is the same as the attribute parameter in Range.rows_from_range.
         """
         if keyfactory is None: keyfactory = lambda key: key
-        headers = [keyfactory(key) for key in self.headers()]
+        headers = [keyfactory(key) for key in self.iterheaders()]
 
-        data = [collections.OrderedDict(list(zip(headers,row))) for row in self.datarange().rows_from_range(attribute=attribute)]
+        ## dicts preserve insertion order, so OrderedDict isn't required
+        data = [dict(zip(headers,row)) for row in self.datarange().rows_from_range(attribute=attribute)]
         data.insert(0,headers)
         return data
     
     def getcolumnnumberbyheader(self, name: str, keyfactory: typing.Callable = None)-> int|None:
         """ Returns the column number with the given name or None if not found. """
-        for cell in self.headers("cell"):
+        ## Headers are read lazily (via iterheaders) so that the search stops at the first match
+        for cell in self.iterheaders("cell"):
             if (keyfactory(cell.value) if keyfactory else cell.value) == name:
                 return cell.column
         return None
     
 def get_tables_in_worksheet(worksheet: Worksheet)-> list[tuple[Worksheet, EnhancedTable]]:
     """ Returns a list of tuples of all tables ina worksheet formattted: (worksheetobject, EnhancedTable Object) """
-    out: list[tuple[Worksheet, EnhancedTable]] = []
     ## To ensure list integrity, we'll have to copy the list
     ## (Initiating Tables seems to automatically add them to _tables list)
-    tables = list(worksheet._tables)
-    for table in tables:
-        ## New version of openpyxl changes worksheet._tables to a dict subclass
-        if isinstance(table, str):
-            table = worksheet._tables[table]
-        ## Check if it was pre-converted and return it if so
-        if isinstance(table,EnhancedTable):
-            out.append((worksheet,table))
-        ## Otherwise, convert it ourselves
-        else:
-            out.append((worksheet,EnhancedTable.from_table(table,worksheet)))
-    return out
+    ## New version of openpyxl changes worksheet._tables to a dict subclass
+    if isinstance(worksheet._tables, dict): tables = list(worksheet._tables.values())
+    else: tables = list(worksheet._tables)
+    ## Return pre-converted tables as-is, otherwise convert them ourselves
+    return [(worksheet, table if isinstance(table,EnhancedTable) else EnhancedTable.from_table(table,worksheet))
+            for table in tables]
 
 
 def get_all_tables(workbook: Workbook)-> list[tuple[Worksheet,EnhancedTable]]:
@@ -183,6 +186,8 @@ def get_table_by_name(source: Workbook|Worksheet, name: str)-> EnhancedTable:
         sheets = [source,]
     results = []
     for worksheet in sheets:
+        ## Skip Chartsheets, which cannot have tables
+        if isinstance(worksheet, Chartsheet): continue
         ## New version of openpyxl changes ._tables to a dict subclass
         if isinstance(worksheet._tables, dict):
             if name in worksheet._tables:
@@ -192,10 +197,11 @@ def get_table_by_name(source: Workbook|Worksheet, name: str)-> EnhancedTable:
             for table in worksheet._tables:
                 if table.displayName == name:
                     results.append((worksheet,table))
+        ## No need to check the remaining worksheets once a duplicate is found
+        if len(results) > 1:
+            raise ValueError(f'Got multiple values for "{name}"')
     if len(results) == 0:
         return None
-    if len(results) > 1:
-        raise ValueError(f'Got multiple values for "{name}"')
     sheet,table = results[0]
     if isinstance(table,EnhancedTable): return table
     return EnhancedTable.from_table(table,sheet)
@@ -220,11 +226,21 @@ def dicts_to_table(sheet: Worksheet, dinput: list[list|dict], tablename: str = N
     """
     if not isinstance(sheet,Worksheet):
         raise TypeError('sheet must be a worksheet')
-    if not isinstance(dinput,(list,tuple)) or not all(isinstance(item,(dict,list,tuple)) for item in dinput):
+    if not isinstance(dinput,(list,tuple)):
         raise TypeError('dinput should be a list of lists or dicts')
-    t1 = dinput[0].__class__
-    if any(not isinstance(item,t1) for item in dinput):
-        raise TypeError("All dinputs must be the same class")
+    ## In the usual case every item shares a single class, which can be validated once
+    types = {type(item) for item in dinput}
+    if len(types) == 1:
+        t1 = types.pop()
+        if not issubclass(t1,(dict,list,tuple)):
+            raise TypeError('dinput should be a list of lists or dicts')
+    ## Otherwise, items may still be subclasses of the first item's class
+    else:
+        if not all(isinstance(item,(dict,list,tuple)) for item in dinput):
+            raise TypeError('dinput should be a list of lists or dicts')
+        t1 = dinput[0].__class__
+        if any(not isinstance(item,t1) for item in dinput):
+            raise TypeError("All dinputs must be the same class")
     if tablename is None: tablename = ""
     if not isinstance(tablename,str):
         raise TypeError('If supplied, tablename should be a string')
@@ -233,18 +249,22 @@ def dicts_to_table(sheet: Worksheet, dinput: list[list|dict], tablename: str = N
         table = get_table_by_name(sheet,tablename)
     else:
         ## AutoGenerate Tablename
+        ## New version of openpyxl changes ._tables to a dict subclass (keyed by displayName)
+        if isinstance(sheet._tables, dict): existing = set(sheet._tables)
+        else: existing = {table.displayName for table in sheet._tables}
         i = 1
-        while not tablename:
-            tablename = f"Table{i}"
-            t = get_table_by_name(sheet,tablename)
-            if t: tablename = None
+        while f"Table{i}" in existing:
+            i += 1
+        tablename = f"Table{i}"
 
     if start:
         start = Coordinate(start)
-        if table and table.startcoord != start:
-            raise SyntaxError("Cannot supply both an existing table and start")
+        if table:
+            tablestart = table.range.masterstart
+            if (tablestart.row,tablestart.column) != (start.row,start.column):
+                raise SyntaxError("Cannot supply both an existing table and start")
     elif table:
-        start = table.startcoord
+        start = table.range.masterstart
     ## Not start and not table
     else:
         raise ValueError("dicts_to_table requires either start or an existing tablename")
@@ -263,40 +283,40 @@ def dicts_to_table(sheet: Worksheet, dinput: list[list|dict], tablename: str = N
     ## Normalize dinput structure
     if issubclass(t1,dict):
         if headers is None:
-            iheaders = list(itertools.chain.from_iterable([item.keys() for item in dinput]))
             ## Instead of using set, we're going to attempt to conserve at least some of the order of the keys
             ## (at time of writing, all standard dicts memorize input order of keys, which makes them reliable)
-            headers = []
-            for h in iheaders:
-                if h not in headers: headers.append(h)
+            headers = list(dict.fromkeys(key for item in dinput for key in item))
         dinput = [[item.get(key,"") for key in headers] for item in dinput]
     ## Otherwise, dinput items are lists or tuples (or- theoretically- subclasses), so don't do anything
     
     ## If existing table, remove it and rewrite it
     if table:
-        for cell in table.range.cells_by_row(value = "cell"):
-            cell.value = None
-        table.worksheet._tables.remove(table)
+        ## Only blank cells that already exist: accessing a missing cell would create it
+        mincolumn,minrow,maxcolumn,maxrow = table.range.range_boundaries
+        cells = table.worksheet._cells
+        for row in range(minrow,maxrow+1):
+            for column in range(mincolumn,maxcolumn+1):
+                cell = cells.get((row,column))
+                if cell is not None and cell.value is not None:
+                    cell.value = None
+        ## New version of openpyxl changes ._tables to a dict subclass
+        if isinstance(table.worksheet._tables, dict): del table.worksheet._tables[table.name]
+        else: table.worksheet._tables.remove(table)
     ## TODO: we should probably make some attempt to NOT overwrite data in proximity if table extends beyond original constraints
 
-    ## Write Table Headers
-    for coffset,column in enumerate(headers):
-        offset = Coordinate(row=str(0),column=str(coffset))
-        cell = start + offset
-        cell = sheet[cell.toA1string()]
-        cell.value = str(column)
-    ## Write table data
-    ## Start writing row at 1
-    for roffset,row in enumerate(dinput, start = 1):
-        for coffset,column in enumerate(headers):
-            offset = Coordinate(str(roffset),str(coffset))
-            cell = start + offset
-            cell = sheet[cell.toA1string()]
-            cell.value = row[coffset]
+    ## Write the Table Headers followed by the table data, walking the table's cells one row at a time
+    ## (ws.append is not used because it always writes below the last row of the worksheet)
+    startrow,startcolumn = start.row,start.column
+    roffset,coffset = len(dinput),len(headers) - 1
+    cells = sheet.iter_rows(min_row = startrow, max_row = startrow + roffset,
+                            min_col = startcolumn, max_col = startcolumn + coffset)
+    values = itertools.chain([[str(column) for column in headers]], dinput)
+    for rowcells,row in zip(cells,values):
+        for cell,value in zip(rowcells,row):
+            cell.value = value
     ## Add/Re-add Table to sheet
-    endcell = Coordinate(str(roffset),str(coffset))
-    endcell = start + endcell
-    table = Table(displayName = tablename, ref = f"{start.toA1string(False)}:{endcell.toA1string(False)}")
+    ref = f"{get_column_letter(startcolumn)}{startrow}:{get_column_letter(startcolumn + coffset)}{startrow + roffset}"
+    table = Table(displayName = tablename, ref = ref)
     sheet.add_table(table)
     table = EnhancedTable.from_table(table,sheet)
     return table
@@ -326,37 +346,46 @@ def gettablesize(sheet: Worksheet, startcolumn: int, startrow: int, absolute: bo
         ---------------
         Returns a range "A$1$:D$4$"
     """
-    row,column = startrow,startcolumn
-    cell = sheet.cell(row = row, column = column)
-    blank = int(not bool(cell.value))
+    ## Values are read from the worksheet's cell store directly: sheet.cell (and sheet.iter_rows, even with
+    ## values_only) would create a new, empty Cell for every blank position that gets checked
+    cells = sheet._cells
+    def filled(row: int, column: int)-> bool:
+        cell = cells.get((row,column))
+        return cell is not None and bool(cell.value)
+
     ## If cell is blank is not blank under any circumstances it should be counted
     ## If greedycolumns then continue on the first blank if current cell is blank
-    while not blank or (greedycolumns and blank <= greedycolumns):
-        column += 1
-        cell = sheet.cell(row = row, column = column)
-        if cell.value: blank = 0
-        else: blank +=1 
-
-    endcolumn = column - blank 
+    ## (scanend stops reading columns as soon as the header row ends)
+    endcolumn = startcolumn + scanend((filled(startrow,column) for column in itertools.count(startcolumn)), greedycolumns)
     if endcolumn < startcolumn:
         return None
 
-    ## Check row 
-    def blankrow(row):
-        col = 1
-        while col <= endcolumn:
-            if sheet.cell(row = row, column = col).value:
-                return False
-            col += 1
-        return True
-    ## Start check table data 
-    row = 2 
-    norow = int(blankrow(row))
+    ## Start check table data
+    ## A row is blank if it has no values up to the end of the header row
+    firstrow = 2
+    rows = (any(filled(row,column) for column in range(1,endcolumn+1)) for row in itertools.count(firstrow))
     ## See notes above on greedycolumns
-    while not norow or (greedyrows and norow <= greedyrows):
-        row += 1
-        if blankrow(row): norow += 1
-        else: norow = 0
-    ## Current Row does not have value
-    endrow = row - norow
-    return tuple_to_range((startcolumn,startrow,endcolumn,endrow), absolute = absolute)
\ No newline at end of file
+    endrow = firstrow + scanend(rows, greedyrows)
+    return tuple_to_range((startcolumn,startrow,endcolumn,endrow), absolute = absolute)
+
+def scanend(filled: typing.Iterable[bool], greedy: int = 0)-> int:
+    """ Returns the offset of the last filled item in a series, where the series ends at the first blank item
+        or- if greedy is supplied- the first run of more than greedy consecutive blank items.
+
+        filled is consumed lazily and no further items are read once the series has ended, so it may be a
+        generator (or even an infinite iterator, so long as it eventually yields enough blank items).
+        Items beyond the end of filled are considered blank. If the first item is blank (and greedy does not
+        skip it), returns -1.
+    """
+    greedy = greedy or 0
+    end = -1
+    blank = 0
+    for position,isfilled in enumerate(filled):
+        if isfilled:
+            end = position
+            blank = 0
+        else:
+            ## A run longer than greedy ends the series
+            blank += 1
+            if blank > greedy: return end
+    return end
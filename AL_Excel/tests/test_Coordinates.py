@@ -56,5 +56,42 @@ class CoordinateTests(unittest.TestCase):
         c3 = c1 + c2
         self.assertEqual(c3,Coordinates.Coordinate(2,2))
 
+    def test_coordinate_addition_conversion(self):
+        """ Tests that Coordinate.__add__ converts (row,column) tuples and strings, and refuses unknown types """
+        c1 = Coordinates.Coordinate(1,1)
+        self.assertEqual(c1 + ("1","1"),Coordinates.Coordinate(2,2))
+        self.assertEqual(c1 + "R1C1",Coordinates.Coordinate(2,2))
+        self.assertRaises(TypeError, lambda: c1 + object())
+
+    def test_toA1string(self):
+        """ Tests that toA1string places each dollar sign before the part that is absolute """
+        for definition,result,relative in [("A1","A1","A1"),
+                                           ("$A$1","$A$1","A1"),
+                                           ("$A1","$A1","A1"),
+                                           ("A$1","A$1","A1"),
+                                           ("R1C[27]","$AA1","AA1")]:
+            with self.subTest(definition = definition):
+                coordinate = Coordinates.Coordinate(definition)
+                self.assertEqual(coordinate.toA1string(),result)
+                self.assertEqual(coordinate.toA1string(absolute = False),relative)
+
+    def test_from_many(self):
+        """ Tests that Coordinate.from_many matches creating each Coordinate individually """
+        values = ["A1","$B$2","c$3","R1C1","R[2]C[-3]","XFD1048576"]
+        self.assertEqual(Coordinates.Coordinate.from_many(values),[Coordinates.Coordinate(value) for value in values])
+        self.assertEqual(Coordinates.Coordinate.from_many(iter(values)),[Coordinates.Coordinate(value) for value in values])
+        self.assertEqual(Coordinates.Coordinate.from_many([]),[])
+        for values in [["A1","Foobar"],["A1","B2\nC3"],["A1",""]]:
+            with self.subTest(values = values):
+                self.assertRaisesRegex(TypeError,"^Invalid coordinates: ",Coordinates.Coordinate.from_many,values)
+
+    def test_coordinate_hash(self):
+        """ Tests that equal Coordinates hash the same and can be used as dict keys """
+        lookup = {Coordinates.Coordinate("A1"): "relative", Coordinates.Coordinate(1,1): "absolute"}
+        self.assertEqual(len(lookup),2)
+        self.assertEqual(lookup[Coordinates.Coordinate("1","A")],"relative")
+        self.assertEqual(lookup[Coordinates.Coordinate("$A$1")],"absolute")
+        self.assertNotEqual(Coordinates.Coordinate("A1"),"A1")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
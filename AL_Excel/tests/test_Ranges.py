@@ -59,6 +59,17 @@ class RangeTests(unittest.TestCase):
                     all(isinstance(cell,AL_Excel.cell.Cell) for cell in row) for row in rows
                     ))
 
+    def test_row(self):
+        """ Tests that Range.row matches indexing the list of rows_from_range """
+        for solutionname,solution in tests.DATA['RANGES'].items():
+            with self.subTest(solutionname=solutionname, solution = solution):
+                testrange = Ranges.NamedRange(self.workbook,solution['name']).ranges[0]
+                rowcount = len(solution['row_values'])
+                for index in range(-rowcount,rowcount):
+                    self.assertEqual(list(testrange.row(index,"address")),solution['row_values'][index])
+                self.assertRaises(IndexError, testrange.row, rowcount)
+                self.assertRaises(IndexError, testrange.row, -rowcount-1)
+
 class MethodsTest(unittest.TestCase):
     """ Tests for various utility methods of the Ranges module """
     def setUp(self):
@@ -9,6 +9,8 @@ import openpyxl.worksheet.table
 ## This Module
 import AL_Excel
 from AL_Excel.Ranges import tuple_to_range
+## Builtin
+import itertools
 
 class TableTests(unittest.TestCase):
     def setUp(self):
@@ -105,6 +107,23 @@ class EnhancedTableTests(unittest.TestCase):
 
     def test_insertcolumn(self):
         """ Tests that enhanced table can insert a column and update it's reference """
+        enhancedtable = self.tables['testtable_1']
+        enhancedtable.insertcolumn(columnname = "Name")
+        enhancedtable.insertcolumn(columnname = "Name")
+        self.assertEqual([column.name for column in enhancedtable.tableColumns],["Name","Name 2","Name 2 2","Value"])
+        self.assertEqual(enhancedtable.ref,"A1:D3")
+
+    def test_getcolumnnumberbyheader(self):
+        """ Tests looking up column numbers by header, with and without a keyfactory """
+        enhancedtable = self.tables['testtable_1']
+        self.assertEqual(enhancedtable.getcolumnnumberbyheader("Value"),2)
+        self.assertIsNone(enhancedtable.getcolumnnumberbyheader("value"))
+        self.assertEqual(enhancedtable.getcolumnnumberbyheader("value",keyfactory = AL_Excel.lowerstrip),2)
+        self.assertIsNone(enhancedtable.getcolumnnumberbyheader("Foobar"))
+        ## Edits to the header cells are seen by later lookups
+        enhancedtable.worksheet["B1"].value = "Amount"
+        self.assertEqual(enhancedtable.getcolumnnumberbyheader("Amount"),2)
+        self.assertIsNone(enhancedtable.getcolumnnumberbyheader("Value"))
 
 class MethodCase(unittest.TestCase):
     """ TestCase for various utility methods """
@@ -118,6 +137,24 @@ class MethodCase(unittest.TestCase):
                 self.assertEqual(tuple_to_range(test, absolute = absolute),result)
 
 
+    def test_scanend(self):
+        """ Tests that scanend finds the end of a series and stops reading once the series has ended """
+        for filled,greedy,result in [([],0,-1),
+                                     ([False,True],0,-1),
+                                     ([True,True,False,True],0,1),
+                                     ([True,True,False,True],1,3),
+                                     ([True,False,False,True],1,0),
+                                     ([True,False,False,True],2,3)]:
+            with self.subTest(filled = filled, greedy = greedy):
+                self.assertEqual(Tables.scanend(filled,greedy),result)
+        ## Infinite series are fine so long as they end with a blank run
+        series = itertools.chain([True,False,True],itertools.repeat(False))
+        self.assertEqual(Tables.scanend(series,1),2)
+        self.assertEqual(next(series),False)
+        series = iter([True,False,False,True])
+        self.assertEqual(Tables.scanend(series),0)
+        self.assertEqual(list(series),[False,True])
+
     def test_gettablesize(self):
         """ Tests gettablesize for a variety of table shapes """
         tests.basicsetup(self)
@@ -160,6 +197,34 @@ class MethodCase(unittest.TestCase):
         self.assertEqual(Tables.gettablesize(sheet, c1, r1), "A1:A3")
 
 
+    def test_gettablesize_no_cells_created(self):
+        """ Tests that gettablesize neither creates cells nor scans past the end of the table """
+        tests.basicsetup(self)
+        ws = self.workbook.create_sheet("testsheet")
+        for row in range(1,4):
+            for column in range(1,6):
+                ws.cell(row = row, column = column, value = "value")
+        ## Unrelated data further down the sheet
+        for row in range(10,1000):
+            ws.cell(row = row, column = 1, value = row)
+            ws.cell(row = row, column = 30, value = row)
+
+        ## Record which rows are looked up in the worksheet's cell store
+        class RecordingCells(dict):
+            def get(self, key, default = None):
+                rows.add(key[0])
+                return super().get(key, default)
+        rows = set()
+        ws._cells = RecordingCells(ws._cells)
+        cellcount = len(ws._cells)
+
+        for greedyrows,result in [(0,"A1:E3"),(5,"A1:E3"),(6,"A1:E999")]:
+            with self.subTest(greedyrows = greedyrows, result = result):
+                rows.clear()
+                self.assertEqual(Tables.gettablesize(ws, 1, 1, greedyrows = greedyrows), result)
+                self.assertEqual(len(ws._cells),cellcount)
+                if result == "A1:E3": self.assertEqual(max(rows),4 + greedyrows)
+
     def test_get_table_by_name(self):
         """ Basic Tests for get_table_by_name """
         tests.basicsetup(self)
@@ -187,5 +252,58 @@ class MethodCase(unittest.TestCase):
         self.assertEqual(len(output),len(testdata))
         self.assertEqual(output,testdata)
 
+    def test_dicts_to_table_offset_lists(self):
+        """ Tests adding a table of lists which does not start at A1 """
+        tests.basicsetup(self)
+        ws = self.workbook.create_sheet("testsheet")
+        testdata = [[1, "a"],
+                    [2, "b"]]
+        table = Tables.dicts_to_table(ws, testdata, start = "C3", headers = ["number","letter"])
+        self.assertEqual(table.ref,"C3:D5")
+        self.assertEqual([[cell.value for cell in row] for row in ws["C3:D5"]],[["number","letter"]]+testdata)
+        ## Nothing should be written outside of the table
+        self.assertIsNone(ws["B3"].value)
+        self.assertIsNone(ws["E5"].value)
+        self.assertIsNone(ws["C6"].value)
+
+    def test_dicts_to_table_autoname(self):
+        """ Tests that dicts_to_table generates a new tablename for each table added to a worksheet """
+        tests.basicsetup(self)
+        ws = self.workbook.create_sheet("testsheet")
+        testdata = [dict(a = 1, b = 1)]
+        table1 = Tables.dicts_to_table(ws, testdata, start = "A1")
+        table2 = Tables.dicts_to_table(ws, testdata, start = "D1")
+        self.assertEqual((table1.displayName,table2.displayName),("Table1","Table2"))
+
+    def test_dicts_to_table_types(self):
+        """ Tests dicts_to_table's validation of dinput's item types """
+        tests.basicsetup(self)
+        ws = self.workbook.create_sheet("testsheet")
+        for testdata in [[1, 2],
+                         [dict(a = 1), [1,]],
+                         [[1,], dict(a = 1)]]:
+            with self.subTest(testdata = testdata):
+                self.assertRaises(TypeError, Tables.dicts_to_table, ws, testdata, start = "A1", headers = ["a",])
+        ## Subclasses of the first item's class are accepted
+        import collections
+        testdata = [dict(a = 1), collections.OrderedDict(a = 2)]
+        table = Tables.dicts_to_table(ws, testdata, start = "A1")
+        self.assertEqual(table.todicts()[1:],testdata)
+
+    def test_dicts_to_table_existing(self):
+        """ Tests rewriting an existing table by tablename """
+        tests.basicsetup(self)
+        sheet = self.sheet_Tables1
+        testdata = [dict(Name = "Foo", Value = 3)]
+        table = Tables.dicts_to_table(sheet, testdata, tablename = "testtable_1")
+        self.assertEqual(table.ref,"A1:B2")
+        self.assertEqual(table.todicts()[1:],testdata)
+        ## Cells from the old table are blanked
+        self.assertEqual([sheet["A3"].value,sheet["B3"].value],[None,None])
+        ## start may be supplied if it matches the existing table
+        table = Tables.dicts_to_table(sheet, testdata, tablename = "testtable_1", start = "$A$1")
+        self.assertEqual(table.ref,"A1:B2")
+        self.assertRaises(SyntaxError, Tables.dicts_to_table, sheet, testdata, tablename = "testtable_1", start = "C1")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file